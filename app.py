@@ -1,8 +1,10 @@
 import io
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 
 # Import the scraper function from your existing file
 from flipkart_scraper import scrape_books
@@ -38,18 +40,140 @@ num_pages = st.sidebar.slider(
 st.sidebar.markdown("---")
 st.sidebar.info("Click **Run Scraper** to start scraping.")
 
+
+# ---------------------------
+# CACHED HELPERS
+# ---------------------------
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_scrape(num_pages: int) -> pd.DataFrame:
+    """Scrape once per page count; repeat runs within an hour reuse the result."""
+    return scrape_books(num_pages=num_pages)
+
+
+@st.cache_data(show_spinner=False)
+def _apply_filters(
+    df: pd.DataFrame,
+    price_order: np.ndarray,
+    price_sorted: np.ndarray,
+    keyword: str,
+    ratings: tuple[str, ...],
+    lo: float,
+    hi: float,
+    sort_order: np.ndarray | None,
+) -> pd.DataFrame:
+    """Return the rows matching the filter widgets, in the chosen order."""
+    # All filters are combined into one boolean mask, so the DataFrame
+    # is only indexed once instead of once per filter
+
+    # Price range: two binary searches over the pre-sorted prices give
+    # the matching rows as one contiguous slice of price_order
+    bounds = np.asarray([lo, hi], dtype=price_sorted.dtype)
+    lo_i = np.searchsorted(price_sorted, bounds[0], side="left")
+    hi_i = np.searchsorted(price_sorted, bounds[1], side="right")
+    mask = np.zeros(len(df), dtype=bool)
+    mask[price_order[lo_i:hi_i]] = True
+
+    if keyword:
+        mask &= (
+            df["_title_lc"]
+            .str.contains(keyword.lower(), regex=False, na=False)
+            .to_numpy(dtype=bool)
+        )
+
+    if ratings:
+        # Look each row's small integer category code up in a table of
+        # allowed ratings: one gather instead of hashing every value.
+        # Missing ratings have code -1 and hit the trailing False slot.
+        rating = df["rating"].cat
+        selected = rating.categories.get_indexer(ratings)
+        allowed = np.zeros(len(rating.categories) + 1, dtype=bool)
+        allowed[selected[selected >= 0]] = True
+        mask &= allowed[rating.codes.to_numpy()]
+
+    if sort_order is None:
+        filtered_df = df[mask]
+    else:
+        # Keep the precomputed sorted row order, minus the filtered-out
+        # rows: an O(n) gather instead of an O(n log n) sort
+        filtered_df = df.iloc[sort_order[mask[sort_order]]]
+
+    return filtered_df.drop(columns="_title_lc")
+
+
+@st.cache_data(show_spinner=False)
+def _describe(prices: pd.Series) -> pd.Series:
+    """Summary statistics (count, mean, quartiles, ...) for a price column."""
+    return prices.describe()
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame to CSV bytes with Arrow's C++ CSV writer."""
+    output = io.BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output)
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame to zstd-compressed Parquet bytes."""
+    output = io.BytesIO()
+    df.to_parquet(output, engine="pyarrow", compression="zstd", index=False)
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _to_excel_bytes(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame to .xlsx bytes."""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="data")
+    return output.getvalue()
+
+
 # ---------------------------
 # MAIN ACTION BUTTON
 # ---------------------------
 if st.button("🚀 Run Scraper"):
     with st.spinner("Scraping books... please wait..."):
-        df = scrape_books(num_pages=num_pages)
+        df = _cached_scrape(num_pages)
+    st.session_state["df"] = df
+
+    # Row order by price, built once per scrape so the price filter can
+    # binary-search instead of comparing every row on each slider move
+    prices = df["price_clean"].to_numpy()
+    price_order = np.argsort(prices, kind="stable")
+    st.session_state["price_order"] = price_order
+    st.session_state["price_sorted"] = prices[price_order]
+
+    # Row orders for each sort option, also built once per scrape
+    title_order = df["title"].argsort(kind="stable").to_numpy()
+    st.session_state["sort_orders"] = {
+        "Price: Low to High": price_order,
+        "Price: High to Low": price_order[::-1],
+        "Title (A–Z)": title_order,
+        "Title (Z–A)": title_order[::-1],
+    }
 
     st.success(
         f"Scraping completed! Collected **{len(df)} books** "
         f"from **{num_pages} pages**."
     )
 
+# ---------------------------
+# RESULTS
+# ---------------------------
+# The scraped data lives in session_state, so the dashboard stays
+# visible when a filter widget triggers a rerun
+if "df" in st.session_state:
+    df = st.session_state["df"]
+    # the same data without the search helper column, for tables and exports
+    table_df = df.drop(columns="_title_lc")
+    # Prices are formatted by the browser instead of a pandas Styler
+    table_config = {
+        "price_clean": st.column_config.NumberColumn(format="£%.2f"),
+    }
+
     # -----------------------
     # KEY METRICS (KPIs)
     # -----------------------
@@ -72,7 +196,7 @@ if st.button("🚀 Run Scraper"):
     # =======================
     with tab1:
         st.subheader("💡 Price Summary")
-        st.write(df["price_clean"].describe())
+        st.write(_describe(df["price_clean"]))
 
         # Charts
         col1, col2 = st.columns(2)
@@ -80,12 +204,21 @@ if st.button("🚀 Run Scraper"):
         # Price distribution
         with col1:
             st.markdown("**Price Distribution**")
-            fig1, ax1 = plt.subplots()
-            ax1.hist(df["price_clean"], bins=10)
-            ax1.set_xlabel("Price (£)")
-            ax1.set_ylabel("Number of Books")
-            ax1.set_title("Distribution of Book Prices")
-            st.pyplot(fig1)
+            # Bin with numpy and draw with Streamlit's native chart,
+            # which is far lighter than building a matplotlib figure
+            counts, edges = np.histogram(df["price_clean"], bins=10)
+            hist_df = pd.DataFrame(
+                {"Number of Books": counts},
+                index=[
+                    f"£{lo:.2f}–{hi:.2f}" for lo, hi in zip(edges, edges[1:])
+                ],
+            )
+            st.bar_chart(
+                hist_df,
+                x_label="Price (£)",
+                y_label="Number of Books",
+                sort=False,
+            )
 
         # Rating counts
         with col2:
@@ -104,36 +237,41 @@ if st.button("🚀 Run Scraper"):
         st.subheader("⬇️ Download Full Dataset")
 
         # CSV download
-        csv_bytes = df.to_csv(index=False).encode("utf-8")
         st.download_button(
             label="Download Full Data (CSV)",
-            data=csv_bytes,
+            data=_to_csv_bytes(table_df),
             file_name="books_data.csv",
             mime="text/csv",
         )
 
-        # Excel download
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            df.to_excel(writer, index=False, sheet_name="data")
-        excel_bytes = output.getvalue()
-
+        # Parquet download (columnar and binary, much faster to write)
         st.download_button(
-            label="Download Full Data (Excel)",
-            data=excel_bytes,
-            file_name="books_data.xlsx",
-            mime=(
-                "application/vnd.openxmlformats-officedocument."
-                "spreadsheetml.sheet"
-            ),
+            label="Download Full Data (Parquet)",
+            data=_to_parquet_bytes(table_df),
+            file_name="books_data.parquet",
+            mime="application/vnd.apache.parquet",
         )
 
+        # Excel download (writing .xlsx is slow, so only build it on request)
+        if st.checkbox("Also prepare an Excel file", key="want_excel"):
+            st.download_button(
+                label="Download Full Data (Excel)",
+                data=_to_excel_bytes(table_df),
+                file_name="books_data.xlsx",
+                mime=(
+                    "application/vnd.openxmlformats-officedocument."
+                    "spreadsheetml.sheet"
+                ),
+            )
+
     # =======================
     # TAB 2: DATA TABLE + FILTERS
     # =======================
     with tab2:
         st.subheader("📘 Full Dataset")
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(
+            table_df, use_container_width=True, column_config=table_config
+        )
 
         st.markdown("---")
         st.subheader("🔍 Filter Books")
@@ -147,7 +285,7 @@ if st.button("🚀 Run Scraper"):
         # Rating filter
         rating_filter = st.multiselect(
             "Filter by Rating:",
-            options=sorted(df["rating"].dropna().unique()),
+            options=df["rating"].dropna().unique().sort_values(),
             key="rating_filter",
         )
 
@@ -162,22 +300,6 @@ if st.button("🚀 Run Scraper"):
             key="price_range",
         )
 
-        # Apply filters
-        filtered_df = df.copy()
-
-        if search_keyword:
-            filtered_df = filtered_df[
-                filtered_df["title"].str.contains(search_keyword, case=False)
-            ]
-
-        if rating_filter:
-            filtered_df = filtered_df[filtered_df["rating"].isin(rating_filter)]
-
-        filtered_df = filtered_df[
-            (filtered_df["price_clean"] >= price_range[0])
-            & (filtered_df["price_clean"] <= price_range[1])
-        ]
-
         # -------- Sorting --------
         st.subheader("⬇️ Sort Books")
 
@@ -193,29 +315,30 @@ if st.button("🚀 Run Scraper"):
             key="sort_option",
         )
 
-        if sort_option == "Price: Low to High":
-            filtered_df = filtered_df.sort_values(
-                "price_clean", ascending=True
-            )
-        elif sort_option == "Price: High to Low":
-            filtered_df = filtered_df.sort_values(
-                "price_clean", ascending=False
-            )
-        elif sort_option == "Title (A–Z)":
-            filtered_df = filtered_df.sort_values("title", ascending=True)
-        elif sort_option == "Title (Z–A)":
-            filtered_df = filtered_df.sort_values("title", ascending=False)
+        # Filtering and sorting are cached, so reruns with the same
+        # widget values skip the work entirely
+        filtered_df = _apply_filters(
+            df,
+            st.session_state["price_order"],
+            st.session_state["price_sorted"],
+            search_keyword,
+            tuple(rating_filter),
+            price_range[0],
+            price_range[1],
+            st.session_state["sort_orders"].get(sort_option),
+        )
 
         st.write(f"Showing {len(filtered_df)} filtered books:")
-        st.dataframe(filtered_df, use_container_width=True)
+        st.dataframe(
+            filtered_df, use_container_width=True, column_config=table_config
+        )
 
         # -------- Download filtered --------
         st.subheader("⬇️ Download Filtered Results")
 
-        csv_bytes_filt = filtered_df.to_csv(index=False).encode("utf-8")
         st.download_button(
             label="Download Filtered Data (CSV)",
-            data=csv_bytes_filt,
+            data=_to_csv_bytes(filtered_df),
             file_name="filtered_books.csv",
             mime="text/csv",
         )
@@ -233,14 +356,14 @@ project using Python.
 **Features:**
 - Scrapes book data (title, price, availability, rating) from BooksToScrape.
 - Cleans and stores data using **pandas**.
-- Generates descriptive statistics and visualisations with **matplotlib**.
-- Provides interactive **filters**, **sorting**, and **downloads** (CSV & Excel).
+- Generates descriptive statistics and visualisations with **NumPy** and Streamlit charts.
+- Provides interactive **filters**, **sorting**, and **downloads** (CSV, Parquet & Excel).
 - Built with **Streamlit** for a simple, modern web UI.
 
 **Tech Stack:**
 - Python
-- Requests, BeautifulSoup
-- Pandas, Matplotlib
+- aiohttp, lxml
+- Pandas, NumPy
 - Streamlit
 """
         )
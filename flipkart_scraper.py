@@ -1,7 +1,11 @@
+import asyncio
 import os
-import requests
+from concurrent.futures import ProcessPoolExecutor
+
+import aiohttp
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 # ---------------------------
 # CONFIG
@@ -14,50 +18,72 @@ HEADERS = {
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
-    )
+    ),
+    # pages are ~50KB of HTML but only ~8KB gzipped
+    "Accept-Encoding": "gzip, deflate",
 }
 
+# At most this many connections are opened to the site; further pages
+# wait for a free one and reuse it through HTTP keep-alive
+MAX_CONNECTIONS = 10
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Output columns, in DataFrame order
+COLUMNS = ("title", "price_raw", "availability", "rating", "price_clean")
+
+# Star ratings in ascending order, used as ordered categories
+RATINGS = ["One", "Two", "Three", "Four", "Five"]
+
+# XPath expressions are compiled once at import time and reused for every page
+_ARTICLES = etree.XPath("//article[@class='product_pod']")
+_TITLE = etree.XPath("string(.//h3/a/@title)")
+_PRICE = etree.XPath("normalize-space(.//p[@class='price_color'])")
+_AVAIL = etree.XPath("normalize-space(.//p[contains(@class, 'instock')])")
+_RATING = etree.XPath("string(.//p[contains(@class, 'star-rating')]/@class)")
+
 
 # ---------------------------
 # HELPERS
 # ---------------------------
 
-def get_page(url: str) -> str:
-    """Download page HTML."""
+async def _fetch(session: aiohttp.ClientSession, url: str) -> bytes:
+    """
+    Download page HTML as raw bytes. lxml reads the charset from the
+    page itself, so there is no need to decode to str first.
+    """
     print(f"Fetching: {url}")
-    resp = requests.get(url, headers=HEADERS, timeout=15)
-    resp.raise_for_status()
-    return resp.text
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        return await resp.read()
 
 
-def parse_books(html: str) -> list[dict]:
-    """Extract book data from a single page."""
-    soup = BeautifulSoup(html, "lxml")
-    books = []
+def parse_books(html: bytes | str) -> dict[str, list]:
+    """Extract book data from a single page, as one list per column."""
+    doc = lxml_html.fromstring(html)
+    books: dict[str, list] = {col: [] for col in COLUMNS}
 
-    articles = soup.select("article.product_pod")
-    for art in articles:
+    for art in _ARTICLES(doc):
         # title
-        title = art.h3.a["title"]
+        title = _TITLE(art)
 
         # price text, e.g. "£51.77" or sometimes appears as "Â51.77"
-        price_text = art.select_one("p.price_color").get_text(strip=True)
+        price_text = _PRICE(art)
+        # dropping non-ASCII characters strips the currency sign (£, Â)
+        price_clean = float(price_text.encode("ascii", "ignore"))
 
         # availability
-        availability = art.select_one("p.instock.availability").get_text(strip=True)
+        availability = _AVAIL(art)
 
-        # rating (e.g. "Three", "Four")
-        rating_tag = art.select_one("p.star-rating")
-        rating = rating_tag["class"][1] if rating_tag and len(rating_tag["class"]) > 1 else None
+        # rating (e.g. "Three", "Four") from class="star-rating Three"
+        rating_classes = _RATING(art).split()
+        rating = rating_classes[1] if len(rating_classes) > 1 else None
 
-        books.append(
-            {
-                "title": title,
-                "price_raw": price_text,
-                "availability": availability,
-                "rating": rating,
-            }
-        )
+        books["title"].append(title)
+        books["price_raw"].append(price_text)
+        books["availability"].append(availability)
+        books["rating"].append(rating)
+        books["price_clean"].append(price_clean)
 
     return books
 
@@ -66,38 +92,82 @@ def parse_books(html: str) -> list[dict]:
 # SCRAPER
 # ---------------------------
 
-def scrape_books(num_pages: int = 5) -> pd.DataFrame:
+def page_url(page: int) -> str:
+    """Return the catalogue URL for a 1-based page number."""
+    if page == 1:
+        return BASE_URL
+    return f"{BASE_URL}catalogue/page-{page}.html"
+
+
+async def _fetch_and_parse(
+    session: aiohttp.ClientSession, executor: ProcessPoolExecutor, url: str
+) -> dict[str, list]:
+    """Download one page and hand it to a worker process for parsing."""
+    html = await _fetch(session, url)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, parse_books, html)
+
+
+async def _scrape_books_async(num_pages: int) -> pd.DataFrame:
     """
-    Scrape the first num_pages pages from books.toscrape.com
-    and return a pandas DataFrame.
+    Download all pages concurrently. Each page is parsed in a worker
+    process as soon as it arrives, while the others are still downloading.
     """
-    all_books: list[dict] = []
+    urls = [page_url(page) for page in range(1, num_pages + 1)]
+    max_workers = min(len(urls), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+        async with aiohttp.ClientSession(
+            headers=HEADERS, timeout=REQUEST_TIMEOUT, connector=connector
+        ) as session:
+            pages = await asyncio.gather(
+                *[_fetch_and_parse(session, executor, url) for url in urls]
+            )
+
+    # Concatenate column by column so pandas builds each column in one
+    # pass instead of transposing a list of row dicts
+    all_books: dict[str, list] = {col: [] for col in COLUMNS}
+
+    for page, page_books in enumerate(pages, start=1):
+        print(f"  -> found {len(page_books['title'])} books on page {page}")
+        for col in COLUMNS:
+            all_books[col].extend(page_books[col])
 
-    for page in range(1, num_pages + 1):
-        if page == 1:
-            url = BASE_URL
-        else:
-            url = f"{BASE_URL}catalogue/page-{page}.html"
+    df = pd.DataFrame(all_books)
 
-        html = get_page(url)
-        page_books = parse_books(html)
-        print(f"  -> found {len(page_books)} books on page {page}")
-        all_books.extend(page_books)
+    # Low-cardinality text columns are stored as categoricals: one small
+    # integer code per row instead of a Python string
+    df["rating"] = pd.Categorical(df["rating"], categories=RATINGS, ordered=True)
+    df["availability"] = df["availability"].astype("category")
 
-    df = pd.DataFrame(all_books)
+    # Prices have two decimal places, so float32 holds them without loss
+    # at half the memory of float64
+    df["price_clean"] = df["price_clean"].astype("float32")
 
-    # -------- PRICE CLEANING FIX --------
-    # Remove anything that is NOT a digit or dot (handles £, Â, etc.)
-    df["price_clean"] = (
-        df["price_raw"]
-        .str.replace(r"[^0-9.]", "", regex=True)   # keep only 0–9 and .
-        .astype(float)
-    )
-    # ------------------------------------
+    # Arrow-backed strings let str.contains/str.lower run as vectorised
+    # pyarrow kernels instead of looping over Python str objects
+    df["title"] = df["title"].astype("string[pyarrow]")
+
+    # Lower-cased copy of the title so searches can use a plain,
+    # case-sensitive substring match. Underscore columns are helpers
+    # and are left out of the tables and exports.
+    df["_title_lc"] = df["title"].str.lower()
 
     return df
 
 
+def scrape_books(num_pages: int = 5) -> pd.DataFrame:
+    """
+    Scrape the first num_pages pages from books.toscrape.com
+    and return a pandas DataFrame.
+
+    All pages are requested at once, so the total wait is roughly the
+    slowest single page rather than the sum of every page.
+    """
+    return asyncio.run(_scrape_books_async(num_pages))
+
+
 # ---------------------------
 # MAIN
 # ---------------------------
@@ -117,6 +187,6 @@ if __name__ == "__main__":
 
     # save to CSV
     output_path = os.path.join("data", "books_data.csv")
-    df_books.to_csv(output_path, index=False)
+    df_books.drop(columns="_title_lc").to_csv(output_path, index=False)
 
     print(f"\nData saved to {output_path}")